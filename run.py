@@ -16,42 +16,118 @@ Usage:
 """
 
 import http.server
-import socketserver
 import threading
 import time
+import types
 import webbrowser
 import signal
+import socket
 import sys
 import os
 import json
-from functools import partial
+from functools import lru_cache, partial
 
 # Configuration
 DEFAULT_PORT = 8888
 HEARTBEAT_TIMEOUT = 120  # seconds without heartbeat before shutdown (browsers heavily throttle background tabs)
 HEARTBEAT_CHECK_INTERVAL = 5  # seconds between heartbeat checks
 SHUTDOWN_GRACE_PERIOD = 3  # seconds to wait after shutdown request (allows reload)
+MAX_CACHED_FILE_SIZE = 1024 * 1024  # bytes; larger HTML files are streamed with sendfile
+SOCKET_BUFFER_SIZE = 262144  # bytes for SO_SNDBUF/SO_RCVBUF on the server socket
+LISTEN_ADDRESS = '127.0.0.1'  # IPv4 loopback; the port probe and the bind must use the same address
+KEEP_ALIVE_TIMEOUT = 5  # seconds before an idle keep-alive connection is closed
+MAX_DRAINED_BODY_SIZE = 64 * 1024  # bytes of POST body read to keep a connection alive
 
 # Config file path (same directory as script)
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.pomodoro_config.json')
 
 # Global state
-last_heartbeat = time.time()
 server = None
-shutdown_flag = threading.Event()
-shutdown_requested = False
-shutdown_request_time = 0
+_shutdown = False
+heartbeat_cv = threading.Condition()  # Guards heartbeat/shutdown state, wakes the monitor
+server_ready = threading.Event()  # Set once the server socket is bound and listening
+
+# Heartbeat state shared by handler threads and the monitor (guarded by heartbeat_cv)
+STATE = types.SimpleNamespace(
+    last_heartbeat=time.monotonic(),
+    shutdown_requested=False,
+    shutdown_request_time=0.0,
+)
+
+# Complete responses built by serve_no_cache (status line, headers and body):
+# (abs path, keep_alive) -> (mtime_ns, bytes)
+_response_cache = {}
+
+# Headers for no-cache HTML responses, encoded once (Content-Length is appended per file)
+NO_CACHE_HTML_HEADERS = (
+    b"Content-Type: text/html; charset=utf-8\r\n"
+    b"Cache-Control: no-cache, no-store, must-revalidate\r\n"
+    b"Pragma: no-cache\r\n"
+    b"Expires: 0\r\n"
+)
+
+# Connection headers for responses on a persistent (HTTP/1.1 keep-alive) connection
+KEEP_ALIVE_HEADERS = (
+    b"Connection: keep-alive\r\n"
+    b"Keep-Alive: timeout=%d\r\n" % KEEP_ALIVE_TIMEOUT
+)
+
+
+def _prebuilt_responses(headers, body):
+    """Encode a fixed 200 response once per connection mode, keyed by keep_alive."""
+    return {
+        keep_alive: (
+            b"HTTP/1.1 200 OK\r\n"
+            + headers
+            + b"Content-Length: %d\r\n" % len(body)
+            + (KEEP_ALIVE_HEADERS if keep_alive else b"")
+            + b"\r\n"
+            + body
+        )
+        for keep_alive in (True, False)
+    }
+
+
+# Full responses for GET /heartbeat, written in one go on the hottest path
+HEARTBEAT_RESPONSES = _prebuilt_responses(
+    b"Content-Type: text/plain\r\n"
+    b"Cache-Control: no-cache\r\n",
+    b"ok",
+)
+
+# Full responses for POST /shutdown (sendBeacon on tab close/reload)
+SHUTDOWN_RESPONSES = _prebuilt_responses(
+    b"Content-Type: text/plain\r\n",
+    b"noted",
+)
+
+# Request paths that are never logged
+_SUPPRESS_LOG_PATHS = ('/heartbeat', '/shutdown', '/fonts/')
+
+# Parsed config, invalidated when the config file's mtime changes
+_config_cache = {'mtime': None, 'data': None}
+
+# Bound once to skip module attribute lookups on the config/file paths
+_exists = os.path.exists
+_stat = os.stat
+_json_load = json.load
 
 
 def load_config():
     """Load configuration from file."""
     defaults = {'port': DEFAULT_PORT}
-    if os.path.exists(CONFIG_FILE):
+    if _exists(CONFIG_FILE):
         try:
+            mtime = _stat(CONFIG_FILE).st_mtime_ns
+            if mtime == _config_cache['mtime']:
+                return dict(_config_cache['data'])
             with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return {**defaults, **config}
-        except:
+                config = _json_load(f)
+            _config_cache['mtime'] = mtime
+            _config_cache['data'] = {**defaults, **config}
+            return dict(_config_cache['data'])
+        except (OSError, ValueError, TypeError):
+            # Unreadable, malformed (JSONDecodeError is a ValueError) or non-object config
             pass
     return defaults
 
@@ -60,6 +136,9 @@ def save_config(config):
     """Save configuration to file."""
     with open(CONFIG_FILE, 'w') as f:
         json.dump(config, f, indent=2)
+    # Update cache directly so the next load doesn't re-read the file
+    _config_cache['mtime'] = _stat(CONFIG_FILE).st_mtime_ns
+    _config_cache['data'] = {'port': DEFAULT_PORT, **config}
 
 
 def show_config():
@@ -84,35 +163,60 @@ def set_port(port):
 class PomodoroHandler(http.server.SimpleHTTPRequestHandler):
     """Custom HTTP handler with heartbeat and shutdown endpoints."""
 
+    # Keep connections open so heartbeats reuse one TCP connection
+    protocol_version = 'HTTP/1.1'
+    # Close idle keep-alive connections instead of holding a thread per socket
+    timeout = KEEP_ALIVE_TIMEOUT
+
+    # URL path -> absolute file path, filled once at startup by build_path_map()
+    PATH_MAP = {}
+
     def __init__(self, *args, directory=None, **kwargs):
         self.directory = directory
         super().__init__(*args, directory=directory, **kwargs)
 
+    def handle_one_request(self):
+        # path would otherwise carry over from the previous request on a
+        # keep-alive connection, and hide errors raised before parse_request
+        self.path = ''
+        super().handle_one_request()
+
     def log_message(self, format, *args):
         """Suppress default logging for cleaner output."""
-        msg = str(args[0]) if args else ''
-        # Hide heartbeat, shutdown, and static asset requests
-        if '/heartbeat' in msg or '/shutdown' in msg or '/fonts/' in msg:
+        # Hide heartbeat, shutdown, and static asset requests before any formatting
+        # (path is empty if the request line failed to parse)
+        if self.path.startswith(_SUPPRESS_LOG_PATHS):
             return
-        print(f"[{self.log_date_time_string()}] {msg}")
+        sys.stdout.write(f"[{self.log_date_time_string()}] {format % args}\n")
 
-    def do_GET(self):
-        global last_heartbeat, shutdown_requested
+    def log_error(self, format, *args):
+        """Skip idle keep-alive timeouts, which are expected rather than errors."""
+        if format.startswith('Request timed out'):
+            return
+        super().log_error(format, *args)
 
+    def end_headers(self):
+        """Advertise keep-alive on every response that leaves the connection open."""
+        if not self.close_connection:
+            self.send_header('Connection', 'keep-alive')
+            self.send_header('Keep-Alive', f'timeout={KEEP_ALIVE_TIMEOUT}')
+        super().end_headers()
+
+    def do_GET(self):
         if self.path == '/heartbeat':
-            last_heartbeat = time.time()
-            shutdown_requested = False  # Cancel any pending shutdown (page reloaded)
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/plain')
-            self.send_header('Cache-Control', 'no-cache')
-            self.end_headers()
-            self.wfile.write(b'ok')
+            with heartbeat_cv:
+                STATE.last_heartbeat = time.monotonic()
+                STATE.shutdown_requested = False  # Cancel any pending shutdown (page reloaded)
+                heartbeat_cv.notify()
+            # Prebuilt response: skips send_response/send_header formatting and logging
+            self.wfile.write(HEARTBEAT_RESPONSES[not self.close_connection])
             return
 
         if self.path == '/shutdown':
             # Use POST /shutdown instead - this just acknowledges
             self.send_response(200)
             self.send_header('Content-Type', 'text/plain')
+            self.send_header('Content-Length', '8')
             self.end_headers()
             self.wfile.write(b'use POST')
             return
@@ -128,107 +232,216 @@ class PomodoroHandler(http.server.SimpleHTTPRequestHandler):
         return super().do_GET()
 
     def serve_no_cache(self):
-        """Serve file with no-cache headers."""
+        """Serve file with no-cache headers.
+
+        Files up to MAX_CACHED_FILE_SIZE are cached as complete responses and
+        sent with a single write; larger ones are streamed with sendfile.
+        """
+        keep_alive = not self.close_connection
         try:
-            file_path = os.path.join(self.directory, self.path.lstrip('/'))
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html; charset=utf-8')
-            self.send_header('Content-Length', len(content))
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
-            self.end_headers()
-            self.wfile.write(content)
+            file_path = PomodoroHandler.PATH_MAP.get(self.path)
+            if file_path is None:
+                self.send_error(404, 'File not found')
+                return
+            st = _stat(file_path)
+            cached = _response_cache.get((file_path, keep_alive))
+            f = None
+            if cached and cached[0] == st.st_mtime_ns:
+                response = cached[1]
+            elif st.st_size <= MAX_CACHED_FILE_SIZE:
+                with open(file_path, 'rb') as cf:
+                    content = cf.read()
+                response = self._no_cache_head(len(content), keep_alive) + content
+                _response_cache[(file_path, keep_alive)] = (st.st_mtime_ns, response)
+            else:
+                f = open(file_path, 'rb')
         except Exception as e:
             self.send_error(404, f'File not found: {e}')
+            return
+
+        self.log_request(200)
+
+        if f is None:
+            self.wfile.write(response)
+            return
+
+        # Only reached for HTML over MAX_CACHED_FILE_SIZE; the shipped
+        # index.html (~100 KB) is always served from the cache above
+        head = self._no_cache_head(st.st_size, keep_alive)
+        with f:
+            self.wfile.write(head)
+            self.wfile.flush()
+            # Kernel-to-kernel copy; socket.sendfile falls back to send()
+            # itself where os.sendfile is unavailable
+            self.connection.sendfile(f)
+
+    def _no_cache_head(self, length, keep_alive):
+        """Build the status line and headers for a no-cache HTML response."""
+        return (
+            f"{self.protocol_version} 200 OK\r\n".encode('latin-1')
+            + NO_CACHE_HTML_HEADERS
+            + (KEEP_ALIVE_HEADERS if keep_alive else b"")
+            + b"Content-Length: %d\r\n\r\n" % length
+        )
 
     def do_POST(self):
         """Handle POST requests (for sendBeacon)."""
-        global shutdown_requested, shutdown_request_time
+        # Consume the request body so the connection can be reused; a body we
+        # can't frame (chunked or bad Content-Length) or that is too large to
+        # bother reading (sendBeacon sends none) means closing instead
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = 0
+            self.close_connection = True
+        if 'Transfer-Encoding' in self.headers or not 0 <= length <= MAX_DRAINED_BODY_SIZE:
+            length = 0
+            self.close_connection = True
+        if length:
+            self.rfile.read(length)
 
         if self.path == '/shutdown':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(b'noted')
+            self.wfile.write(SHUTDOWN_RESPONSES[not self.close_connection])
             # Don't shutdown immediately - set flag and let heartbeat monitor decide
             # This allows page reloads without killing the server
-            shutdown_requested = True
-            shutdown_request_time = time.time()
+            with heartbeat_cv:
+                STATE.shutdown_requested = True
+                STATE.shutdown_request_time = time.monotonic()
+                heartbeat_cv.notify()
             return
 
         self.send_response(404)
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
 
+def build_path_map(root):
+    """Map servable URL paths to absolute file paths under root (skips dotfiles)."""
+    path_map = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d != '__pycache__']
+        for name in filenames:
+            if name.startswith('.'):
+                continue
+            abs_path = os.path.join(dirpath, name)
+            rel = os.path.relpath(abs_path, root)
+            path_map['/' + rel.replace(os.sep, '/')] = abs_path
+    return path_map
+
+
+def create_listening_socket(port):
+    """Bind and listen on localhost:port with the server's socket options."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Try SO_REUSEPORT if available (macOS/Linux)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        except (AttributeError, OSError):
+            pass
+        # Disable Nagle so small responses (heartbeat "ok") aren't delayed
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+        sock.bind((LISTEN_ADDRESS, port))
+        sock.listen(socket.SOMAXCONN)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
 def find_available_port(start_port=DEFAULT_PORT):
-    """Find an available port starting from start_port."""
-    import socket
+    """Find an available port starting from start_port.
 
+    Returns (port, sock) where sock is already listening on the port, so the
+    server can take it over without a second bind that someone could race.
+    """
     port = start_port
     while port < start_port + 100:
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                try:
-                    s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-                except (AttributeError, OSError):
-                    pass
-                s.bind(('localhost', port))
-                return port
-        except OSError:
-            port += 1
+            # Nobody else may be accepting on the port (SO_REUSEPORT lets
+            # another listener share it, so bind alone isn't proof). Probe
+            # before binding so the probe can't land on our own socket, and
+            # probe the exact address we bind rather than whatever 'localhost'
+            # resolves to (e.g. an unusable ::1 would mask the IPv4 refusal).
+            try:
+                socket.create_connection((LISTEN_ADDRESS, port), timeout=0.05).close()
+            except ConnectionRefusedError:
+                # Refused - port really is free, claim it. Report the bound
+                # port, which differs from the requested one for port 0.
+                sock = create_listening_socket(port)
+                return sock.getsockname()[1], sock
+            # Connected, timed out (slow listener) or other error - port is taken
+        except (OSError, OverflowError):
+            pass
+        port += 1
 
     # Fallback: let OS assign a port
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(('localhost', 0))
-        return s.getsockname()[1]
+    sock = create_listening_socket(0)
+    return sock.getsockname()[1], sock
 
 
 def heartbeat_monitor():
-    """Background thread that checks for heartbeat timeout."""
-    global last_heartbeat, shutdown_requested
+    """Background thread that checks for heartbeat timeout.
+
+    Sleeps on heartbeat_cv until the next deadline instead of polling; the
+    request handlers notify it whenever heartbeat state changes.
+    """
+    # Bind hot-loop lookup to a local
+    monotonic = time.monotonic
+
+    reason = None
+    with heartbeat_cv:
+        while True:
+            if _shutdown:
+                break
+            now = monotonic()
 
-    # Give browser time to load and send first heartbeat
-    time.sleep(HEARTBEAT_TIMEOUT)
+            # Check if shutdown was requested (tab close/reload)
+            if STATE.shutdown_requested:
+                # Wait for grace period to see if heartbeat resumes (reload vs close)
+                grace_elapsed = now - STATE.shutdown_request_time
+                heartbeat_elapsed = now - STATE.last_heartbeat
 
-    while not shutdown_flag.is_set():
-        time.sleep(1)  # Check more frequently for better responsiveness
+                if grace_elapsed > SHUTDOWN_GRACE_PERIOD and heartbeat_elapsed > SHUTDOWN_GRACE_PERIOD:
+                    # No heartbeat after grace period - tab was actually closed
+                    reason = "Browser tab closed"
+                    break
+                elif STATE.last_heartbeat > STATE.shutdown_request_time:
+                    # Heartbeat resumed - was just a reload
+                    # (checked against the request time rather than a fixed
+                    # window, since the monitor now wakes on every request)
+                    STATE.shutdown_requested = False
+                    continue
 
-        if shutdown_flag.is_set():
-            break
+                next_deadline = max(STATE.shutdown_request_time, STATE.last_heartbeat) + SHUTDOWN_GRACE_PERIOD
+            else:
+                # Normal heartbeat timeout check
+                elapsed = now - STATE.last_heartbeat
+                if elapsed > HEARTBEAT_TIMEOUT:
+                    reason = f"No heartbeat for {elapsed:.0f} seconds (tab likely closed)"
+                    break
 
-        # Check if shutdown was requested (tab close/reload)
-        if shutdown_requested:
-            # Wait for grace period to see if heartbeat resumes (reload vs close)
-            grace_elapsed = time.time() - shutdown_request_time
-            heartbeat_elapsed = time.time() - last_heartbeat
+                next_deadline = STATE.last_heartbeat + HEARTBEAT_TIMEOUT
 
-            if grace_elapsed > SHUTDOWN_GRACE_PERIOD and heartbeat_elapsed > SHUTDOWN_GRACE_PERIOD:
-                # No heartbeat after grace period - tab was actually closed
-                initiate_shutdown("Browser tab closed")
-                break
-            elif heartbeat_elapsed < 2:
-                # Heartbeat resumed - was just a reload
-                shutdown_requested = False
-                continue
+            heartbeat_cv.wait(timeout=max(next_deadline - now, 0))
 
-        # Normal heartbeat timeout check
-        elapsed = time.time() - last_heartbeat
-        if elapsed > HEARTBEAT_TIMEOUT:
-            initiate_shutdown(f"No heartbeat for {elapsed:.0f} seconds (tab likely closed)")
-            break
+    if reason:
+        initiate_shutdown(reason)
 
 
 def initiate_shutdown(reason="Unknown"):
     """Initiate server shutdown."""
-    if shutdown_flag.is_set():
-        return  # Already shutting down
+    global _shutdown
+
+    with heartbeat_cv:
+        if _shutdown:
+            return  # Already shutting down
+        _shutdown = True
+        heartbeat_cv.notify_all()
 
     print(f"\n[Shutdown] {reason}")
-    shutdown_flag.set()
 
     if server:
         # Shutdown server in a thread to avoid blocking
@@ -237,14 +450,19 @@ def initiate_shutdown(reason="Unknown"):
 
 def signal_handler(signum, frame):
     """Handle Ctrl+C and other termination signals."""
-    signal_name = signal.Signals(signum).name
-    print(f"\n[Shutdown] Received {signal_name}")
-    print("\n[Server stopped]")
-    os._exit(0)
+    if _shutdown:
+        # Second signal while shutting down - give up on a clean exit
+        os._exit(1)
+
+    # Let serve_forever return so main's finally block closes the socket
+    initiate_shutdown(f"Received {signal.Signals(signum).name}")
 
 
+@lru_cache(maxsize=1)
 def is_wsl():
     """Check if running in Windows Subsystem for Linux."""
+    if sys.platform != 'linux':
+        return False  # Skip the /proc read on macOS/Windows
     try:
         with open('/proc/version', 'r') as f:
             return 'microsoft' in f.read().lower()
@@ -252,23 +470,47 @@ def is_wsl():
         return False
 
 
-def open_browser(url):
-    """Open browser after a short delay to ensure server is ready."""
-    time.sleep(0.5)
+# /proc/version never changes at runtime
+_IS_WSL = is_wsl()
+
+# Default browser, resolved on first use (None until then, False if unavailable)
+_BROWSER = None
 
-    if is_wsl():
-        # WSL: Use Windows browser via cmd.exe
-        import subprocess
+
+def _open_native(url):
+    """macOS, Windows, or native Linux with browser installed."""
+    global _BROWSER
+    if _BROWSER is None:
+        # Resolve lazily so CLI commands that never open a browser skip the scan
         try:
-            # cmd.exe /c start opens URL in default Windows browser
-            subprocess.run(['cmd.exe', '/c', 'start', url.replace('&', '^&')],
-                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            return
-        except Exception:
-            pass
+            _BROWSER = webbrowser.get()
+        except webbrowser.Error:
+            _BROWSER = False
+    if not (_BROWSER and _BROWSER.open(url)):
+        # Let webbrowser fall back through the rest of its try order
+        webbrowser.open(url)
+
+
+def _open_wsl(url):
+    """WSL: Use Windows browser via cmd.exe."""
+    import subprocess
+    # cmd.exe treats & as a command separator
+    cmd_url = url.replace('&', '^&') if '&' in url else url
+    try:
+        # cmd.exe /c start opens URL in default Windows browser
+        subprocess.run(['cmd.exe', '/c', 'start', cmd_url],
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except Exception:
+        _open_native(url)
 
-    # macOS, Windows, or native Linux with browser installed
-    webbrowser.open(url)
+
+_open = _open_wsl if _IS_WSL else _open_native
+
+
+def open_browser(url):
+    """Open browser once the server is ready to accept connections."""
+    server_ready.wait(2.0)
+    _open(url)
 
 
 def print_help():
@@ -287,40 +529,47 @@ Usage:
 
 
 def main():
-    global server, last_heartbeat
+    global server
 
-    # Simple arg parsing
+    # Simple arg parsing: one pass over argv, flags map to True and port
+    # options to their int value (None if missing or invalid)
     args = sys.argv[1:]
-
-    if '--help' in args or '-h' in args:
+    parsed = {}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in ('--set-port', '--port'):
+            try:
+                parsed[arg] = int(args[i + 1])
+                i += 1
+            except (IndexError, ValueError):
+                parsed[arg] = None
+        else:
+            parsed[arg] = True
+        i += 1
+
+    if '--help' in parsed or '-h' in parsed:
         print_help()
         return
 
-    if '--config' in args:
+    if '--config' in parsed:
         show_config()
         return
 
-    if '--set-port' in args:
-        try:
-            idx = args.index('--set-port')
-            port = int(args[idx + 1])
-            set_port(port)
-            return
-        except (IndexError, ValueError):
+    if '--set-port' in parsed:
+        if parsed['--set-port'] is None:
             print("Error: --set-port requires a port number")
-            return
+        else:
+            set_port(parsed['--set-port'])
+        return
 
-    # Parse remaining options
-    no_browser = '--no-browser' in args
-    session_port = None
+    # Remaining options
+    no_browser = '--no-browser' in parsed
+    session_port = parsed.get('--port')
 
-    if '--port' in args:
-        try:
-            idx = args.index('--port')
-            session_port = int(args[idx + 1])
-        except (IndexError, ValueError):
-            print("Error: --port requires a port number")
-            return
+    if '--port' in parsed and session_port is None:
+        print("Error: --port requires a port number")
+        return
 
     # Load config
     config = load_config()
@@ -332,34 +581,42 @@ def main():
     preferred_port = session_port if session_port else config.get('port', DEFAULT_PORT)
 
     # Find available port
-    port = find_available_port(preferred_port)
+    port, listening_sock = find_available_port(preferred_port)
     url = f"http://localhost:{port}"
 
     if port != preferred_port:
         print(f"Note: Port {preferred_port} was busy, using {port} instead")
 
-    # Set up signal handlers
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # Resolve servable files once so requests are a dict lookup
+    PomodoroHandler.PATH_MAP = build_path_map(script_dir)
 
     # Create handler with custom directory
     handler = partial(PomodoroHandler, directory=script_dir)
 
-    # Create server with reusable address and port
-    class ReusableTCPServer(socketserver.TCPServer):
-        allow_reuse_address = True
-
-        def server_bind(self):
-            import socket
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            # Try SO_REUSEPORT if available (macOS/Linux)
-            try:
-                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
-            except (AttributeError, OSError):
-                pass
-            super().server_bind()
-
-    server = ReusableTCPServer(("localhost", port), handler)
+    # ThreadingHTTPServer handles each request in its own thread, so a slow
+    # asset read can't hold up /heartbeat or /shutdown
+    class ReusableTCPServer(http.server.ThreadingHTTPServer):
+        daemon_threads = True
+
+        def get_request(self):
+            conn, addr = self.socket.accept()
+            # Not every kernel inherits TCP_NODELAY from the listening socket
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return conn, addr
+
+    # Take over the socket find_available_port already bound and listened on
+    server = ReusableTCPServer(("localhost", port), handler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = listening_sock
+    server.server_address = listening_sock.getsockname()
+    server.server_name, server.server_port = 'localhost', port
+    server_ready.set()
+
+    # Set up signal handlers only once server exists, so initiate_shutdown always
+    # has something to stop (a shutdown requested before serve_forever starts
+    # makes it return immediately)
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
 
     print(f"""
     ===============================
@@ -374,8 +631,10 @@ def main():
 
     """)
 
-    # Reset heartbeat timestamp
-    last_heartbeat = time.time()
+    # Reset heartbeat timestamp (first deadline is now + HEARTBEAT_TIMEOUT,
+    # giving the browser time to load and send its first heartbeat)
+    with heartbeat_cv:
+        STATE.last_heartbeat = time.monotonic()
 
     # Start heartbeat monitor thread
     monitor_thread = threading.Thread(target=heartbeat_monitor, daemon=True)
@@ -390,7 +649,7 @@ def main():
     try:
         server.serve_forever()
     except Exception as e:
-        if not shutdown_flag.is_set():
+        if not _shutdown:
             print(f"Server error: {e}")
     finally:
         # Properly close socket to release port immediately